@@ -1,12 +1,54 @@
+import functools
+import logging
+import orjson
+import random
 import requests
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+
+log = logging.getLogger("shasta_sdk")
 
 # Constants (replace with actual token and base URL as needed)
 BASE_URL = "https://api-stg.shastacloud.com"
 MSP_ORG_ID = "317"
 BEARER_TOKEN = "your_bearer_token_here"
-MAX_RETRIES = 5  # Maximum number of retries
-RETRY_BACKOFF_FACTOR = 2  # Exponential backoff factor (in seconds)
+MAX_RETRIES = 8  # Maximum number of retries
+RETRY_BACKOFF_BASE = 1.0  # Base delay for exponential backoff (in seconds)
+RETRY_BACKOFF_CAP = 30.0  # Upper bound on a single backoff delay (in seconds)
+RETRY_AFTER_CAP = 120.0  # Upper bound on a server-requested Retry-After delay (in seconds)
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)  # Transient errors worth retrying
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")  # Safe to resend after a 5xx
+REQUEST_TIMEOUT = 30  # Per-request timeout (in seconds)
+POOL_CONNECTIONS = 4  # Number of host pools to cache
+POOL_MAXSIZE = 32  # Keep-alive connections per host; must cover caller concurrency
+ETAG_CACHE_MAXSIZE = 256  # Maximum number of GET responses kept for conditional requests
+
+# Endpoint URLs, built once at import time
+_ORGANIZATION_URL = f"{BASE_URL}/organization"
+_ORG_CHILD_URL = f"{BASE_URL}/organization/{MSP_ORG_ID}/child"
+_VENUES_URL = f"{BASE_URL}/venues"
+_INFRA_URL = f"{BASE_URL}/infrastructure"
+_INFRATYPE_URL = f"{BASE_URL}/infrastructure/infratype"
+
+# Read-only query parameters for endpoints whose parameters never change
+_INFRATYPE_PARAMS = MappingProxyType({"orgId": MSP_ORG_ID})
+
+# JSON request bodies with the static fields pre-serialized; each %b takes an
+# orjson-encoded value so strings are escaped exactly as orjson.dumps would
+_BUSINESS_ORG_TEMPLATE = (
+    b'{"orgDisplayName":%b,"orgTypeId":%b,"parentOrgId":%b,"phone":"","notes":"",'
+    b'"billingRecipients":"","orgAddress":{"addressLine":%b},"billingAddress":{"addressLine":%b}}'
+)
+_VENUE_TEMPLATE = (
+    b'{"orgId":%b,"parentVenueId":0,"venueName":%b,"state":1,"venueType":1,'
+    b'"venueAddress":{"addressLine":%b},"shippingAddress":{"addressLine":%b}}'
+)
 
 # Headers for authentication
 HEADERS = {
@@ -14,16 +56,224 @@ HEADERS = {
     "Content-Type": "application/json"
 }
 
-def handle_request_with_retries(method, url, headers=None, params=None, json=None):
+# Shared session so the TLS connection to BASE_URL is reused across calls
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+# Retries stay at 0 on the adapter so handle_request_with_retries owns retry logic
+_ADAPTER = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+def close():
+    """
+    Closes the shared HTTP session and releases its pooled connections.
+    """
+    _SESSION.close()
+    with _etag_lock:
+        _etag_cache.clear()
+
+# Functions wrapped by _ttl_cache, used by invalidate_cache()
+_CACHED_FUNCTIONS = []
+# Separates positional from keyword arguments in cache keys, like functools' kwd_mark
+_KWARGS_MARK = object()
+
+def _ttl_cache(seconds, maxsize=128):
+    """
+    Caches a function's results in-process for a fixed time.
+
+    Entries are evicted least-recently-used first once maxsize is reached,
+    and expired entries are dropped when looked up. Results are stored
+    serialized with orjson and decoded on every hit, so each caller gets an
+    independent copy; the wrapped function must return JSON-serializable data.
+
+    Parameters:
+        seconds (float): How long a cached result stays valid.
+        maxsize (int): Maximum number of cached results.
+
+    Returns:
+        callable: Decorator that caches results keyed by the call arguments.
+    """
+    def decorator(fn):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        cache.move_to_end(key)
+                        return orjson.loads(entry[1])
+                    del cache[key]
+            value = fn(*args, **kwargs)
+            serialized = orjson.dumps(value)
+            with lock:
+                cache[key] = (now + seconds, serialized)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        _CACHED_FUNCTIONS.append(wrapper)
+        return wrapper
+    return decorator
+
+def invalidate_cache(fn=None):
+    """
+    Clears cached results.
+
+    Parameters:
+        fn (callable, optional): Cached function to clear. Clears all caches,
+            including stored conditional-GET responses, if omitted.
+    """
+    for cached in ([fn] if fn is not None else _CACHED_FUNCTIONS):
+        cached.cache_clear()
+    if fn is None:
+        with _etag_lock:
+            _etag_cache.clear()
+
+# Validators and bodies of GET responses, keyed by (method, url, params) and
+# evicted least-recently-used first once ETAG_CACHE_MAXSIZE is reached
+_etag_cache = OrderedDict()
+_etag_lock = threading.Lock()
+
+def _business_org_body(org_display_name, org_type_id, parent_org_id, address):
+    """
+    Serializes the request body for creating a business organization.
+
+    Parameters:
+        org_display_name (str): Display name of the organization.
+        org_type_id (int): Type ID of the organization.
+        parent_org_id (int): Parent organization ID.
+        address (str): Address of the organization.
+
+    Returns:
+        bytes: JSON request body.
+    """
+    address = orjson.dumps(address)
+    return _BUSINESS_ORG_TEMPLATE % (
+        orjson.dumps(org_display_name), orjson.dumps(org_type_id), orjson.dumps(parent_org_id), address, address
+    )
+
+def _venue_body(org_id, venue_name, address):
+    """
+    Serializes the request body for creating a venue.
+
+    Parameters:
+        org_id (int): ID of the organization.
+        venue_name (str): Name of the venue.
+        address (str): Address of the venue.
+
+    Returns:
+        bytes: JSON request body.
+    """
+    address = orjson.dumps(address)
+    return _VENUE_TEMPLATE % (orjson.dumps(org_id), orjson.dumps(venue_name), address, address)
+
+def _infrastructure_body(org_id, venue_id, infra_type_id, mac_address, infra_display_name):
     """
-    Handles API requests with retry mechanism for 429 errors.
+    Serializes the request body for adding infrastructure.
+
+    Five of the nine fields are dynamic, so splicing them into a template is
+    no faster than serializing the dict directly.
+
+    Parameters:
+        org_id (int): ID of the organization.
+        venue_id (int): ID of the venue.
+        infra_type_id (int): Type ID of the infrastructure.
+        mac_address (str): MAC address of the infrastructure.
+        infra_display_name (str): Display name of the infrastructure.
+
+    Returns:
+        bytes: JSON request body.
+    """
+    return orjson.dumps({
+        "venueId": venue_id,
+        "orgId": org_id,
+        "infraTypeId": infra_type_id,
+        "macAddress": mac_address,
+        "serialNumber": "",
+        "assetTag": "",
+        "infraDisplayName": infra_display_name,
+        "sourceId": 1,
+        "realInfra": False
+    })
+
+def _json(response):
+    """
+    Decodes a JSON response body with orjson.
+
+    Parameters:
+        response (Response): The HTTP response.
+
+    Returns:
+        dict: The decoded JSON body.
+    """
+    return orjson.loads(response.content)
+
+def _parse_retry_after(value):
+    """
+    Parses a Retry-After header value.
+
+    Parameters:
+        value (str): Header value, either delay-seconds or an HTTP-date.
+
+    Returns:
+        float: Seconds to wait, capped at RETRY_AFTER_CAP, or 0 if the value cannot be parsed.
+    """
+    if not value:
+        return 0.0
+    value = value.strip()
+    # RFC 9110 delay-seconds is a non-negative integer; anything else must be an HTTP-date
+    if value.isascii() and value.isdigit():
+        return min(float(int(value)), RETRY_AFTER_CAP)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return min(max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()), RETRY_AFTER_CAP)
+
+def _backoff_delay(retries):
+    """
+    Computes a full-jitter exponential backoff delay.
+
+    Parameters:
+        retries (int): Number of retries already attempted.
+
+    Returns:
+        float: Seconds to wait before the next attempt.
+    """
+    # Full jitter keeps concurrent callers from retrying in lockstep
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * (2 ** retries)))
+
+def handle_request_with_retries(method, url, headers=None, params=None, json=None, data=None):
+    """
+    Handles API requests with retry mechanism for 429, 5xx and connection errors.
+
+    GET requests are sent as conditional requests when an earlier response
+    carried an ETag or Last-Modified header. A 304 response is returned with
+    the previously downloaded body, so it decodes exactly like a 200.
+
+    5xx responses are only retried for idempotent methods so that a POST the
+    server may already have processed is never sent twice.
 
     Parameters:
         method (str): HTTP method (e.g., "GET", "POST", "DELETE").
         url (str): URL of the API endpoint.
-        headers (dict): Headers to include in the request.
+        headers (dict, optional): Extra headers to merge with the session headers.
         params (dict, optional): Query parameters for the request.
         json (dict, optional): JSON body for the request.
+        data (bytes, optional): Pre-serialized body for the request.
 
     Returns:
         Response object: The HTTP response.
@@ -31,19 +281,69 @@ def handle_request_with_retries(method, url, headers=None, params=None, json=Non
     Raises:
         Exception: If retries exceed MAX_RETRIES.
     """
+    cache_key = None
+    cached = None
+    if method.upper() == "GET":
+        cache_key = (method.upper(), url, frozenset((params or {}).items()))
+        with _etag_lock:
+            cached = _etag_cache.get(cache_key)
+            if cached is not None:
+                _etag_cache.move_to_end(cache_key)
+        if cached is not None:
+            etag, last_modified, _ = cached
+            headers = dict(headers or {})
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
     retries = 0
+    last_error = None
     while retries <= MAX_RETRIES:
-        response = requests.request(method, url, headers=headers, params=params, json=json)
-        if response.status_code == 429:  # Too Many Requests
-            wait_time = RETRY_BACKOFF_FACTOR ** retries
-            print(f"Rate limited. Retrying in {wait_time} seconds...")
-            time.sleep(wait_time)
-            retries += 1
+        try:
+            response = _SESSION.request(method, url, headers=headers, params=params, json=json,
+                                        data=data, timeout=REQUEST_TIMEOUT)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # A read timeout means the server may have acted on the request
+            if isinstance(e, requests.exceptions.ReadTimeout) and method.upper() not in IDEMPOTENT_METHODS:
+                raise
+            last_error = e
+            if retries == MAX_RETRIES:
+                break  # Out of retries; don't sleep before giving up
+            wait_time = _backoff_delay(retries)
+            log.warning("Request failed on %s %s (%s); sleeping %.2fs (retry %d/%d)",
+                        method, url, e, wait_time, retries + 1, MAX_RETRIES)
         else:
-            response.raise_for_status()  # Raise an error for non-200 status codes
-            return response
-    raise Exception(f"Failed after {MAX_RETRIES} retries due to rate limiting.")
-
+            # Non-idempotent requests are only resent on 429, never after a 5xx
+            retryable = response.status_code == 429 or (
+                response.status_code in RETRYABLE_STATUS_CODES and method.upper() in IDEMPOTENT_METHODS
+            )
+            if not retryable:
+                response.raise_for_status()  # Raise an error for non-200 status codes
+                if response.status_code == 304 and cached is not None:
+                    # Response.content is a read-only property backed by _content; setting
+                    # it hands every caller the cached body through the usual _json() path
+                    response._content = cached[2]
+                elif cache_key is not None and response.status_code == 200:
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        with _etag_lock:
+                            _etag_cache[cache_key] = (etag, last_modified, response.content)
+                            _etag_cache.move_to_end(cache_key)
+                            while len(_etag_cache) > ETAG_CACHE_MAXSIZE:
+                                _etag_cache.popitem(last=False)
+                return response
+            if retries == MAX_RETRIES:
+                break  # Out of retries; don't sleep before giving up
+            wait_time = max(_parse_retry_after(response.headers.get("Retry-After")), _backoff_delay(retries))
+            log.warning("Received %d on %s %s; sleeping %.2fs (retry %d/%d)",
+                        response.status_code, method, url, wait_time, retries + 1, MAX_RETRIES)
+        time.sleep(wait_time)
+        retries += 1
+    raise Exception(f"Failed after {MAX_RETRIES} retries.") from last_error
+
+@_ttl_cache(60)
 def get_business_orgs(offset=0, limit=10, order="DESC", order_by="orgId"):
     """
     Retrieves a list of business organizations.
@@ -57,10 +357,10 @@ def get_business_orgs(offset=0, limit=10, order="DESC", order_by="orgId"):
     Returns:
         dict: JSON response containing business organizations.
     """
-    url = f"{BASE_URL}/organization/{MSP_ORG_ID}/child"
+    url = _ORG_CHILD_URL
     params = {"offset": offset, "limit": limit, "order": order, "orderBy": order_by}
-    response = handle_request_with_retries("GET", url, headers=HEADERS, params=params)
-    return response.json()
+    response = handle_request_with_retries("GET", url, params=params)
+    return _json(response)
 
 def create_business_org(org_display_name, org_type_id, parent_org_id, address):
     """
@@ -75,20 +375,14 @@ def create_business_org(org_display_name, org_type_id, parent_org_id, address):
     Returns:
         dict: JSON response containing the created organization's details.
     """
-    url = f"{BASE_URL}/organization"
-    payload = {
-        "orgDisplayName": org_display_name,
-        "orgTypeId": org_type_id,
-        "parentOrgId": parent_org_id,
-        "phone": "",
-        "notes": "",
-        "billingRecipients": "",
-        "orgAddress": {"addressLine": address},
-        "billingAddress": {"addressLine": address}
-    }
-    response = handle_request_with_retries("POST", url, headers=HEADERS, json=payload)
-    return response.json()
-
+    url = _ORGANIZATION_URL
+    body = _business_org_body(org_display_name, org_type_id, parent_org_id, address)
+    response = handle_request_with_retries("POST", url, data=body)
+    invalidate_cache(get_business_orgs)
+    invalidate_cache(find_business_org)
+    return _json(response)
+
+@_ttl_cache(60)
 def find_business_org(search_query, offset=0, limit=10, order="DESC", order_by="orgId"):
     """
     Searches for a specific business organization.
@@ -103,10 +397,10 @@ def find_business_org(search_query, offset=0, limit=10, order="DESC", order_by="
     Returns:
         dict: JSON response containing the search results.
     """
-    url = f"{BASE_URL}/organization/{MSP_ORG_ID}/child"
+    url = _ORG_CHILD_URL
     params = {"search": search_query, "offset": offset, "limit": limit, "order": order, "orderBy": order_by}
-    response = handle_request_with_retries("GET", url, headers=HEADERS, params=params)
-    return response.json()
+    response = handle_request_with_retries("GET", url, params=params)
+    return _json(response)
 
 def remove_business_org(org_id):
     """
@@ -118,10 +412,14 @@ def remove_business_org(org_id):
     Returns:
         int: HTTP status code of the response.
     """
-    url = f"{BASE_URL}/organization/{org_id}"
-    response = handle_request_with_retries("DELETE", url, headers=HEADERS)
+    url = f"{_ORGANIZATION_URL}/{org_id}"
+    response = handle_request_with_retries("DELETE", url)
+    invalidate_cache(get_business_orgs)
+    invalidate_cache(find_business_org)
+    invalidate_cache(get_venues)
     return response.status_code
 
+@_ttl_cache(60)
 def get_venues(org_id, offset=0, limit=10, order="DESC", order_by="venueId", search_query=None):
     """
     Retrieves venues for a specific organization.
@@ -137,12 +435,12 @@ def get_venues(org_id, offset=0, limit=10, order="DESC", order_by="venueId", sea
     Returns:
         dict: JSON response containing the venues.
     """
-    url = f"{BASE_URL}/venues"
+    url = _VENUES_URL
     params = {"orgId": org_id, "offset": offset, "limit": limit, "order": order, "orderBy": order_by}
     if search_query:
         params["search"] = search_query
-    response = handle_request_with_retries("GET", url, headers=HEADERS, params=params)
-    return response.json()
+    response = handle_request_with_retries("GET", url, params=params)
+    return _json(response)
 
 def create_venue(org_id, venue_name, address):
     """
@@ -156,18 +454,11 @@ def create_venue(org_id, venue_name, address):
     Returns:
         dict: JSON response containing the created venue's details.
     """
-    url = f"{BASE_URL}/venues"
-    payload = {
-        "orgId": org_id,
-        "parentVenueId": 0,
-        "venueName": venue_name,
-        "state": 1,
-        "venueType": 1,
-        "venueAddress": {"addressLine": address},
-        "shippingAddress": {"addressLine": address}
-    }
-    response = handle_request_with_retries("POST", url, headers=HEADERS, json=payload)
-    return response.json()
+    url = _VENUES_URL
+    body = _venue_body(org_id, venue_name, address)
+    response = handle_request_with_retries("POST", url, data=body)
+    invalidate_cache(get_venues)
+    return _json(response)
 
 def remove_venue(venue_id):
     """
@@ -179,8 +470,9 @@ def remove_venue(venue_id):
     Returns:
         int: HTTP status code of the response.
     """
-    url = f"{BASE_URL}/venues/{venue_id}"
-    response = handle_request_with_retries("DELETE", url, headers=HEADERS)
+    url = f"{_VENUES_URL}/{venue_id}"
+    response = handle_request_with_retries("DELETE", url)
+    invalidate_cache(get_venues)
     return response.status_code
 
 def get_infrastructure_by_org(org_id):
@@ -193,9 +485,9 @@ def get_infrastructure_by_org(org_id):
     Returns:
         dict: JSON response containing the infrastructure details.
     """
-    url = f"{BASE_URL}/infrastructure/organization/{org_id}"
-    response = handle_request_with_retries("GET", url, headers=HEADERS)
-    return response.json()
+    url = f"{_INFRA_URL}/organization/{org_id}"
+    response = handle_request_with_retries("GET", url)
+    return _json(response)
 
 def get_infrastructure_by_venue(venue_id):
     """
@@ -207,10 +499,11 @@ def get_infrastructure_by_venue(venue_id):
     Returns:
         dict: JSON response containing the infrastructure details.
     """
-    url = f"{BASE_URL}/infrastructure/venue/{venue_id}"
-    response = handle_request_with_retries("GET", url, headers=HEADERS)
-    return response.json()
+    url = f"{_INFRA_URL}/venue/{venue_id}"
+    response = handle_request_with_retries("GET", url)
+    return _json(response)
 
+@_ttl_cache(3600)
 def get_infra_types():
     """
     Retrieves infrastructure types available for the organization.
@@ -218,10 +511,10 @@ def get_infra_types():
     Returns:
         dict: JSON response containing the infrastructure types.
     """
-    url = f"{BASE_URL}/infrastructure/infratype"
-    params = {"orgId": MSP_ORG_ID}
-    response = handle_request_with_retries("GET", url, headers=HEADERS, params=params)
-    return response.json()
+    url = _INFRATYPE_URL
+    params = _INFRATYPE_PARAMS
+    response = handle_request_with_retries("GET", url, params=params)
+    return _json(response)
 
 def add_infrastructure(org_id, venue_id, infra_type_id, mac_address, infra_display_name):
     """
@@ -237,20 +530,10 @@ def add_infrastructure(org_id, venue_id, infra_type_id, mac_address, infra_displ
     Returns:
         dict: JSON response containing the created infrastructure details.
     """
-    url = f"{BASE_URL}/infrastructure"
-    payload = {
-        "venueId": venue_id,
-        "orgId": org_id,
-        "infraTypeId": infra_type_id,
-        "macAddress": mac_address,
-        "serialNumber": "",
-        "assetTag": "",
-        "infraDisplayName": infra_display_name,
-        "sourceId": 1,
-        "realInfra": False
-    }
-    response = handle_request_with_retries("POST", url, headers=HEADERS, json=payload)
-    return response.json()
+    url = _INFRA_URL
+    body = _infrastructure_body(org_id, venue_id, infra_type_id, mac_address, infra_display_name)
+    response = handle_request_with_retries("POST", url, data=body)
+    return _json(response)
 
 def remove_infrastructure(infra_id):
     """
@@ -262,10 +545,128 @@ def remove_infrastructure(infra_id):
     Returns:
         int: HTTP status code of the response.
     """
-    url = f"{BASE_URL}/infrastructure/{infra_id}"
-    response = handle_request_with_retries("DELETE", url, headers=HEADERS)
+    url = f"{_INFRA_URL}/{infra_id}"
+    response = handle_request_with_retries("DELETE", url)
     return response.status_code
 
+def _page_items(page):
+    """
+    Extracts the list of records from a paginated response.
+
+    Parameters:
+        page (dict): JSON response of a paginated endpoint.
+
+    Returns:
+        list: Records contained in the page.
+
+    Raises:
+        ValueError: If the response has no "data" or "items" list.
+    """
+    for key in ("data", "items"):
+        if isinstance(page, dict) and isinstance(page.get(key), list):
+            return page[key]
+    shape = sorted(page) if isinstance(page, dict) else type(page).__name__
+    raise ValueError(f"Unexpected paginated response; expected a 'data' or 'items' list, got {shape}")
+
+def _paginate(fetch_page, limit):
+    """
+    Yields records page by page until a short page is returned.
+
+    Parameters:
+        fetch_page (callable): Called with an offset; returns the page's JSON response.
+        limit (int): Number of results requested per page.
+
+    Yields:
+        dict: One record at a time.
+    """
+    offset = 0
+    while True:
+        items = _page_items(fetch_page(offset))
+        yield from items
+        if len(items) < limit:
+            return
+        offset += limit
+
+def iter_business_orgs(limit=100, order="DESC", order_by="orgId"):
+    """
+    Iterates over all business organizations, fetching one page at a time.
+
+    Pages are requested over the shared session, so after the first page the
+    wall time is dominated by server response time rather than handshakes.
+
+    Parameters:
+        limit (int): Number of results to retrieve per request.
+        order (str): Sort order ("ASC" or "DESC").
+        order_by (str): Field to sort by.
+
+    Returns:
+        generator: Yields one business organization at a time.
+
+    Raises:
+        ValueError: If limit is less than 1.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    return _paginate(lambda offset: get_business_orgs(offset, limit, order, order_by), limit)
+
+def iter_venues(org_id, limit=100, order="DESC", order_by="venueId", search_query=None):
+    """
+    Iterates over all venues of an organization, fetching one page at a time.
+
+    Parameters:
+        org_id (int): ID of the organization.
+        limit (int): Number of results to retrieve per request.
+        order (str): Sort order ("ASC" or "DESC").
+        order_by (str): Field to sort by.
+        search_query (str, optional): Name or other identifier of the venue to search for.
+
+    Returns:
+        generator: Yields one venue at a time.
+
+    Raises:
+        ValueError: If limit is less than 1.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    return _paginate(lambda offset: get_venues(org_id, offset, limit, order, order_by, search_query), limit)
+
+def bulk_call(fn, arg_list, workers=10):
+    """
+    Calls an SDK function for each argument set using a thread pool.
+
+    The shared session's connection pool is thread-safe, so each worker reuses
+    a warm keep-alive connection. POST helpers (create_business_org,
+    create_venue, add_infrastructure) are only safe to parallelize when their
+    inputs (e.g., venue_name, mac_address) are unique.
+
+    Parameters:
+        fn (callable): SDK function to call.
+        arg_list (iterable): Arguments per call; tuples are unpacked as positional arguments.
+        workers (int): Number of worker threads, capped at POOL_MAXSIZE.
+
+    Returns:
+        list: Results in the same order as arg_list.
+    """
+    # More workers than pooled connections would make urllib3 discard sockets
+    if workers > POOL_MAXSIZE:
+        log.debug("Capping bulk_call workers at POOL_MAXSIZE (%d, requested %d)", POOL_MAXSIZE, workers)
+        workers = POOL_MAXSIZE
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda args: fn(*args) if isinstance(args, tuple) else fn(args), arg_list))
+
+def bulk_get_infrastructure_by_org(org_ids, workers=10):
+    """
+    Retrieves infrastructure for several organizations concurrently.
+
+    Parameters:
+        org_ids (iterable): IDs of the organizations.
+        workers (int): Number of worker threads.
+
+    Returns:
+        list: JSON responses in the same order as org_ids.
+    """
+    return bulk_call(get_infrastructure_by_org, org_ids, workers=workers)
+
 # Example usage of the functions
 if __name__ == "__main__":
     try:
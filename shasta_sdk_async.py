@@ -0,0 +1,359 @@
+import asyncio
+import aiohttp
+import logging
+import orjson
+
+from shasta_sdk import (
+    HEADERS,
+    MAX_RETRIES,
+    RETRYABLE_STATUS_CODES,
+    IDEMPOTENT_METHODS,
+    REQUEST_TIMEOUT,
+    POOL_MAXSIZE,
+    _ORGANIZATION_URL,
+    _ORG_CHILD_URL,
+    _VENUES_URL,
+    _INFRA_URL,
+    _INFRATYPE_URL,
+    _INFRATYPE_PARAMS,
+    _business_org_body,
+    _venue_body,
+    _infrastructure_body,
+    _parse_retry_after,
+    _backoff_delay,
+)
+
+log = logging.getLogger("shasta_sdk_async")
+
+KEEPALIVE_TIMEOUT = 60  # Seconds an idle pooled connection is kept open
+
+# Shared session, created lazily so it binds to the caller's running event loop
+_aiohttp_session = None
+_aiohttp_session_loop = None
+
+def _get_session():
+    """
+    Returns the shared aiohttp session, creating it on first use.
+
+    A session is tied to the event loop it was created on, so a new one is
+    created when called from a different loop (e.g., a second asyncio.run()).
+    Call close() before the loop ends to release the old session cleanly.
+
+    Returns:
+        aiohttp.ClientSession: The shared client session.
+    """
+    global _aiohttp_session, _aiohttp_session_loop
+    loop = asyncio.get_running_loop()
+    if _aiohttp_session is None or _aiohttp_session.closed or _aiohttp_session_loop is not loop:
+        _aiohttp_session = aiohttp.ClientSession(
+            headers=HEADERS,
+            connector=aiohttp.TCPConnector(limit=POOL_MAXSIZE, keepalive_timeout=KEEPALIVE_TIMEOUT),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+        )
+        _aiohttp_session_loop = loop
+    return _aiohttp_session
+
+async def close():
+    """
+    Closes the shared aiohttp session and releases its connector.
+    """
+    global _aiohttp_session, _aiohttp_session_loop
+    if _aiohttp_session is not None and _aiohttp_session_loop is asyncio.get_running_loop():
+        await _aiohttp_session.close()
+    _aiohttp_session = None
+    _aiohttp_session_loop = None
+
+async def _json(response):
+    """
+    Decodes a JSON response body with orjson.
+
+    The response has already been released by a_handle_request_with_retries,
+    so the body is taken from json()'s buffered copy; read() would raise
+    "Connection closed" at this point.
+
+    Parameters:
+        response (aiohttp.ClientResponse): The HTTP response.
+
+    Returns:
+        dict: The decoded JSON body.
+    """
+    return await response.json(loads=orjson.loads, content_type=None)
+
+async def a_handle_request_with_retries(method, url, headers=None, params=None, json=None, data=None):
+    """
+    Async counterpart of shasta_sdk.handle_request_with_retries.
+
+    Parameters:
+        method (str): HTTP method (e.g., "GET", "POST", "DELETE").
+        url (str): URL of the API endpoint.
+        headers (dict, optional): Extra headers to merge with the session headers.
+        params (dict, optional): Query parameters for the request.
+        json (dict, optional): JSON body for the request.
+        data (bytes, optional): Pre-serialized body for the request.
+
+    Returns:
+        aiohttp.ClientResponse: The HTTP response, with its body already read.
+
+    Raises:
+        Exception: If retries exceed MAX_RETRIES.
+    """
+    session = _get_session()
+    retries = 0
+    last_error = None
+    while retries <= MAX_RETRIES:
+        try:
+            async with session.request(method, url, headers=headers, params=params, json=json,
+                                        data=data) as response:
+                await response.read()  # Buffer the body so it survives the context exit
+        except aiohttp.ConnectionTimeoutError as e:
+            # The connection was never established, so this is safe to retry for any method
+            last_error = e
+            if retries == MAX_RETRIES:
+                break  # Out of retries; don't sleep before giving up
+            wait_time = _backoff_delay(retries)
+            log.warning("Connection timed out on %s %s; sleeping %.2fs (retry %d/%d)",
+                        method, url, wait_time, retries + 1, MAX_RETRIES)
+        except asyncio.TimeoutError as e:
+            # A timeout means the server may have acted on the request
+            if method.upper() not in IDEMPOTENT_METHODS:
+                raise
+            last_error = e
+            if retries == MAX_RETRIES:
+                break  # Out of retries; don't sleep before giving up
+            wait_time = _backoff_delay(retries)
+            log.warning("Request timed out on %s %s; sleeping %.2fs (retry %d/%d)",
+                        method, url, wait_time, retries + 1, MAX_RETRIES)
+        except aiohttp.ClientConnectionError as e:
+            last_error = e
+            if retries == MAX_RETRIES:
+                break  # Out of retries; don't sleep before giving up
+            wait_time = _backoff_delay(retries)
+            log.warning("Request failed on %s %s (%s); sleeping %.2fs (retry %d/%d)",
+                        method, url, e, wait_time, retries + 1, MAX_RETRIES)
+        else:
+            # Non-idempotent requests are only resent on 429, never after a 5xx
+            retryable = response.status == 429 or (
+                response.status in RETRYABLE_STATUS_CODES and method.upper() in IDEMPOTENT_METHODS
+            )
+            if not retryable:
+                response.raise_for_status()  # Raise an error for non-200 status codes
+                return response
+            if retries == MAX_RETRIES:
+                break  # Out of retries; don't sleep before giving up
+            wait_time = max(_parse_retry_after(response.headers.get("Retry-After")), _backoff_delay(retries))
+            log.warning("Received %d on %s %s; sleeping %.2fs (retry %d/%d)",
+                        response.status, method, url, wait_time, retries + 1, MAX_RETRIES)
+        await asyncio.sleep(wait_time)
+        retries += 1
+    raise Exception(f"Failed after {MAX_RETRIES} retries.") from last_error
+
+async def a_get_business_orgs(offset=0, limit=10, order="DESC", order_by="orgId"):
+    """
+    Retrieves a list of business organizations.
+
+    Parameters:
+        offset (int): Pagination offset.
+        limit (int): Number of results to retrieve per request.
+        order (str): Sort order ("ASC" or "DESC").
+        order_by (str): Field to sort by.
+
+    Returns:
+        dict: JSON response containing business organizations.
+    """
+    url = _ORG_CHILD_URL
+    params = {"offset": offset, "limit": limit, "order": order, "orderBy": order_by}
+    response = await a_handle_request_with_retries("GET", url, params=params)
+    return await _json(response)
+
+async def a_create_business_org(org_display_name, org_type_id, parent_org_id, address):
+    """
+    Creates a new business organization.
+
+    Parameters:
+        org_display_name (str): Display name of the organization.
+        org_type_id (int): Type ID of the organization.
+        parent_org_id (int): Parent organization ID.
+        address (str): Address of the organization.
+
+    Returns:
+        dict: JSON response containing the created organization's details.
+    """
+    url = _ORGANIZATION_URL
+    body = _business_org_body(org_display_name, org_type_id, parent_org_id, address)
+    response = await a_handle_request_with_retries("POST", url, data=body)
+    return await _json(response)
+
+async def a_find_business_org(search_query, offset=0, limit=10, order="DESC", order_by="orgId"):
+    """
+    Searches for a specific business organization.
+
+    Parameters:
+        search_query (str): Name or other identifier of the organization to search for.
+        offset (int): Pagination offset.
+        limit (int): Number of results to retrieve per request.
+        order (str): Sort order ("ASC" or "DESC").
+        order_by (str): Field to sort by.
+
+    Returns:
+        dict: JSON response containing the search results.
+    """
+    url = _ORG_CHILD_URL
+    params = {"search": search_query, "offset": offset, "limit": limit, "order": order, "orderBy": order_by}
+    response = await a_handle_request_with_retries("GET", url, params=params)
+    return await _json(response)
+
+async def a_remove_business_org(org_id):
+    """
+    Removes a business organization.
+
+    Parameters:
+        org_id (int): ID of the organization to remove.
+
+    Returns:
+        int: HTTP status code of the response.
+    """
+    url = f"{_ORGANIZATION_URL}/{org_id}"
+    response = await a_handle_request_with_retries("DELETE", url)
+    return response.status
+
+async def a_get_venues(org_id, offset=0, limit=10, order="DESC", order_by="venueId", search_query=None):
+    """
+    Retrieves venues for a specific organization.
+
+    Parameters:
+        org_id (int): ID of the organization.
+        offset (int): Pagination offset.
+        limit (int): Number of results to retrieve per request.
+        order (str): Sort order ("ASC" or "DESC").
+        order_by (str): Field to sort by.
+        search_query (str, optional): Name or other identifier of the venue to search for.
+
+    Returns:
+        dict: JSON response containing the venues.
+    """
+    url = _VENUES_URL
+    params = {"orgId": org_id, "offset": offset, "limit": limit, "order": order, "orderBy": order_by}
+    if search_query:
+        params["search"] = search_query
+    response = await a_handle_request_with_retries("GET", url, params=params)
+    return await _json(response)
+
+async def a_create_venue(org_id, venue_name, address):
+    """
+    Creates a new venue for an organization.
+
+    Parameters:
+        org_id (int): ID of the organization.
+        venue_name (str): Name of the venue.
+        address (str): Address of the venue.
+
+    Returns:
+        dict: JSON response containing the created venue's details.
+    """
+    url = _VENUES_URL
+    body = _venue_body(org_id, venue_name, address)
+    response = await a_handle_request_with_retries("POST", url, data=body)
+    return await _json(response)
+
+async def a_remove_venue(venue_id):
+    """
+    Removes a venue.
+
+    Parameters:
+        venue_id (int): ID of the venue to remove.
+
+    Returns:
+        int: HTTP status code of the response.
+    """
+    url = f"{_VENUES_URL}/{venue_id}"
+    response = await a_handle_request_with_retries("DELETE", url)
+    return response.status
+
+async def a_get_infrastructure_by_org(org_id):
+    """
+    Retrieves infrastructure for a specific organization.
+
+    Parameters:
+        org_id (int): ID of the organization.
+
+    Returns:
+        dict: JSON response containing the infrastructure details.
+    """
+    url = f"{_INFRA_URL}/organization/{org_id}"
+    response = await a_handle_request_with_retries("GET", url)
+    return await _json(response)
+
+async def a_get_infrastructure_by_venue(venue_id):
+    """
+    Retrieves infrastructure for a specific venue.
+
+    Parameters:
+        venue_id (int): ID of the venue.
+
+    Returns:
+        dict: JSON response containing the infrastructure details.
+    """
+    url = f"{_INFRA_URL}/venue/{venue_id}"
+    response = await a_handle_request_with_retries("GET", url)
+    return await _json(response)
+
+async def a_get_infra_types():
+    """
+    Retrieves infrastructure types available for the organization.
+
+    Returns:
+        dict: JSON response containing the infrastructure types.
+    """
+    url = _INFRATYPE_URL
+    params = _INFRATYPE_PARAMS
+    response = await a_handle_request_with_retries("GET", url, params=params)
+    return await _json(response)
+
+async def a_add_infrastructure(org_id, venue_id, infra_type_id, mac_address, infra_display_name):
+    """
+    Adds new infrastructure for a venue.
+
+    Parameters:
+        org_id (int): ID of the organization.
+        venue_id (int): ID of the venue.
+        infra_type_id (int): Type ID of the infrastructure.
+        mac_address (str): MAC address of the infrastructure.
+        infra_display_name (str): Display name of the infrastructure.
+
+    Returns:
+        dict: JSON response containing the created infrastructure details.
+    """
+    url = _INFRA_URL
+    body = _infrastructure_body(org_id, venue_id, infra_type_id, mac_address, infra_display_name)
+    response = await a_handle_request_with_retries("POST", url, data=body)
+    return await _json(response)
+
+async def a_remove_infrastructure(infra_id):
+    """
+    Removes an infrastructure item.
+
+    Parameters:
+        infra_id (int): ID of the infrastructure to remove.
+
+    Returns:
+        int: HTTP status code of the response.
+    """
+    url = f"{_INFRA_URL}/{infra_id}"
+    response = await a_handle_request_with_retries("DELETE", url)
+    return response.status
+
+# Example usage of the functions
+if __name__ == "__main__":
+    async def main():
+        try:
+            # Example: Get business orgs
+            orgs = await a_get_business_orgs()
+            print("Business Orgs:", orgs)
+
+            # Add more logic as needed, e.g. asyncio.gather(...) across orgs
+        except Exception as e:
+            print(f"An error occurred: {e}")
+        finally:
+            await close()
+
+    asyncio.run(main())
@@ -0,0 +1,342 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import shasta_sdk
+
+
+def make_response(status_code, body=b"{}", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {})
+    return response
+
+
+class FakeSession:
+    """Stands in for shasta_sdk._SESSION, replaying queued responses or exceptions."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(shasta_sdk.time, "sleep", slept.append)
+    return slept
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    def install(*outcomes):
+        session = FakeSession(*outcomes)
+        monkeypatch.setattr(shasta_sdk, "_SESSION", session)
+        return session
+    return install
+
+
+@pytest.mark.parametrize("method", ["GET", "POST", "DELETE"])
+def test_429_is_retried_for_every_method(fake_session, sleeps, method):
+    session = fake_session(make_response(429), make_response(200))
+    response = shasta_sdk.handle_request_with_retries(method, "https://example.test/x")
+    assert response.status_code == 200
+    assert len(session.calls) == 2
+    assert len(sleeps) == 1
+
+
+@pytest.mark.parametrize("status_code", [500, 502, 503, 504])
+def test_5xx_is_retried_for_get(fake_session, sleeps, status_code):
+    session = fake_session(make_response(status_code), make_response(200))
+    response = shasta_sdk.handle_request_with_retries("GET", "https://example.test/x")
+    assert response.status_code == 200
+    assert len(session.calls) == 2
+
+
+@pytest.mark.parametrize("status_code", [500, 502, 503, 504])
+def test_5xx_is_not_retried_for_post(fake_session, sleeps, status_code):
+    session = fake_session(make_response(status_code), make_response(201))
+    with pytest.raises(requests.exceptions.HTTPError):
+        shasta_sdk.handle_request_with_retries("POST", "https://example.test/x")
+    assert len(session.calls) == 1
+    assert sleeps == []
+
+
+def test_read_timeout_is_not_retried_for_post(fake_session, sleeps):
+    session = fake_session(requests.exceptions.ReadTimeout(), make_response(201))
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        shasta_sdk.handle_request_with_retries("POST", "https://example.test/x")
+    assert len(session.calls) == 1
+
+
+def test_read_timeout_is_retried_for_get(fake_session, sleeps):
+    session = fake_session(requests.exceptions.ReadTimeout(), make_response(200))
+    response = shasta_sdk.handle_request_with_retries("GET", "https://example.test/x")
+    assert response.status_code == 200
+    assert len(session.calls) == 2
+
+
+@pytest.mark.parametrize("error", [requests.exceptions.ConnectionError(), requests.exceptions.ConnectTimeout()])
+def test_connection_errors_are_retried_for_post(fake_session, sleeps, error):
+    session = fake_session(error, make_response(201))
+    response = shasta_sdk.handle_request_with_retries("POST", "https://example.test/x")
+    assert response.status_code == 201
+    assert len(session.calls) == 2
+
+
+def test_client_errors_are_raised_without_retry(fake_session, sleeps):
+    session = fake_session(make_response(404))
+    with pytest.raises(requests.exceptions.HTTPError):
+        shasta_sdk.handle_request_with_retries("GET", "https://example.test/x")
+    assert len(session.calls) == 1
+
+
+def test_gives_up_after_max_retries(fake_session, sleeps):
+    session = fake_session(*[make_response(429) for _ in range(shasta_sdk.MAX_RETRIES + 1)])
+    with pytest.raises(Exception, match="Failed after"):
+        shasta_sdk.handle_request_with_retries("GET", "https://example.test/x")
+    assert len(session.calls) == shasta_sdk.MAX_RETRIES + 1
+    assert len(sleeps) == shasta_sdk.MAX_RETRIES
+
+
+def test_gives_up_after_max_connection_errors(fake_session, sleeps):
+    error = requests.exceptions.ConnectionError()
+    session = fake_session(*[error for _ in range(shasta_sdk.MAX_RETRIES + 1)])
+    with pytest.raises(Exception, match="Failed after") as excinfo:
+        shasta_sdk.handle_request_with_retries("GET", "https://example.test/x")
+    assert excinfo.value.__cause__ is error
+    assert len(session.calls) == shasta_sdk.MAX_RETRIES + 1
+    assert len(sleeps) == shasta_sdk.MAX_RETRIES
+
+
+def test_retry_after_header_sets_minimum_wait(fake_session, sleeps):
+    fake_session(make_response(429, headers={"Retry-After": "7"}), make_response(200))
+    shasta_sdk.handle_request_with_retries("GET", "https://example.test/x")
+    assert sleeps[0] >= 7
+
+
+@pytest.mark.parametrize("value", ["inf", "nan", "1e400", "-3", "garbage"])
+def test_retry_after_rejects_non_integer_seconds(value):
+    assert shasta_sdk._parse_retry_after(value) == 0.0
+
+
+def test_retry_after_is_capped():
+    assert shasta_sdk._parse_retry_after("99999") == shasta_sdk.RETRY_AFTER_CAP
+
+
+def test_ttl_cache_returns_independent_copies():
+    calls = []
+
+    @shasta_sdk._ttl_cache(60)
+    def fetch():
+        calls.append(1)
+        return {"data": [1, 2]}
+
+    fetch()["data"].append(99)  # Mutating a miss result
+    fetch()["data"].append(98)  # Mutating a hit result
+    assert fetch() == {"data": [1, 2]}
+    assert len(calls) == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    calls = []
+
+    @shasta_sdk._ttl_cache(60, maxsize=2)
+    def fetch(key):
+        calls.append(key)
+        return key
+
+    fetch("a")
+    fetch("b")
+    fetch("a")  # "b" is now least recently used
+    fetch("c")
+    fetch("a")
+    fetch("b")
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_ttl_cache_drops_expired_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(shasta_sdk.time, "monotonic", lambda: now[0])
+    calls = []
+
+    @shasta_sdk._ttl_cache(60)
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert fetch() == 1
+    now[0] += 61
+    assert fetch() == 2
+    assert len(calls) == 2
+
+
+@pytest.fixture
+def empty_etag_cache():
+    shasta_sdk.invalidate_cache()
+    yield
+    shasta_sdk.invalidate_cache()
+
+
+def test_304_returns_cached_body(fake_session, empty_etag_cache):
+    session = fake_session(
+        make_response(200, b'{"data": [1, 2]}', headers={"ETag": '"v1"'}),
+        make_response(304, b""),
+    )
+    first = shasta_sdk.handle_request_with_retries("GET", "https://example.test/x", params={"a": 1})
+    second = shasta_sdk.handle_request_with_retries("GET", "https://example.test/x", params={"a": 1})
+    assert session.calls[1][2]["headers"]["If-None-Match"] == '"v1"'
+    assert shasta_sdk._json(first) == shasta_sdk._json(second) == {"data": [1, 2]}
+
+
+def test_conditional_headers_are_only_sent_for_matching_params(fake_session, empty_etag_cache):
+    session = fake_session(
+        make_response(200, headers={"Last-Modified": "Wed, 14 Oct 2026 00:00:00 GMT"}),
+        make_response(200),
+    )
+    shasta_sdk.handle_request_with_retries("GET", "https://example.test/x", params={"a": 1})
+    shasta_sdk.handle_request_with_retries("GET", "https://example.test/x", params={"a": 2})
+    assert session.calls[1][2]["headers"] is None
+
+
+def test_etag_cache_is_bounded(fake_session, empty_etag_cache, monkeypatch):
+    monkeypatch.setattr(shasta_sdk, "ETAG_CACHE_MAXSIZE", 2)
+    fake_session(*[make_response(200, headers={"ETag": '"v"'}) for _ in range(3)])
+    for page in range(3):
+        shasta_sdk.handle_request_with_retries("GET", "https://example.test/x", params={"page": page})
+    pages = [dict(key[2])["page"] for key in shasta_sdk._etag_cache]
+    assert pages == [1, 2]
+
+
+def test_invalidate_cache_clears_etag_cache(fake_session, empty_etag_cache):
+    fake_session(make_response(200, headers={"ETag": '"v1"'}))
+    shasta_sdk.handle_request_with_retries("GET", "https://example.test/x")
+    assert shasta_sdk._etag_cache
+    shasta_sdk.invalidate_cache()
+    assert not shasta_sdk._etag_cache
+
+
+def test_iter_business_orgs_stops_on_short_page(monkeypatch):
+    pages = {0: {"data": [1, 2]}, 2: {"data": [3]}}
+    offsets = []
+
+    def fake_get_business_orgs(offset, limit, order, order_by):
+        offsets.append(offset)
+        return pages[offset]
+
+    monkeypatch.setattr(shasta_sdk, "get_business_orgs", fake_get_business_orgs)
+    assert list(shasta_sdk.iter_business_orgs(limit=2)) == [1, 2, 3]
+    assert offsets == [0, 2]
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_iter_rejects_non_positive_limit(limit):
+    with pytest.raises(ValueError):
+        shasta_sdk.iter_business_orgs(limit=limit)
+    with pytest.raises(ValueError):
+        shasta_sdk.iter_venues(1, limit=limit)
+
+
+def test_iter_rejects_unknown_page_shape(monkeypatch):
+    monkeypatch.setattr(shasta_sdk, "get_venues", lambda *args: {"results": [1]})
+    with pytest.raises(ValueError, match="results"):
+        list(shasta_sdk.iter_venues(1))
+
+
+def test_bulk_call_preserves_input_order():
+    def slow_echo(value):
+        time.sleep(0.01 * (5 - value))  # Later inputs finish first
+        return value
+
+    assert shasta_sdk.bulk_call(slow_echo, range(5), workers=5) == [0, 1, 2, 3, 4]
+
+
+def test_bulk_call_unpacks_tuple_arguments():
+    assert shasta_sdk.bulk_call(lambda a, b: a * b, [(2, 3), (4, 5)]) == [6, 20]
+
+
+def test_bulk_call_caps_workers_at_pool_size(monkeypatch, caplog):
+    created = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            created.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(shasta_sdk, "ThreadPoolExecutor", RecordingExecutor)
+    with caplog.at_level(logging.DEBUG, logger="shasta_sdk"):
+        shasta_sdk.bulk_call(str, [1], workers=shasta_sdk.POOL_MAXSIZE + 10)
+    assert created == [shasta_sdk.POOL_MAXSIZE]
+    assert "Capping bulk_call workers" in caplog.text
+
+
+def test_bulk_get_infrastructure_by_org(monkeypatch):
+    monkeypatch.setattr(shasta_sdk, "get_infrastructure_by_org", lambda org_id: {"orgId": org_id})
+    assert shasta_sdk.bulk_get_infrastructure_by_org([3, 1, 2]) == [{"orgId": 3}, {"orgId": 1}, {"orgId": 2}]
+
+
+def test_ttl_cache_keeps_positional_and_keyword_arguments_apart():
+    @shasta_sdk._ttl_cache(60)
+    def describe(*args, **kwargs):
+        return {"positional": len(args), "keywords": sorted(kwargs)}
+
+    assert describe(("x", 1)) == {"positional": 1, "keywords": []}
+    assert describe(x=1) == {"positional": 0, "keywords": ["x"]}
+
+
+TRICKY = 'Main "HQ"\nSuite \\2 é'
+
+
+def test_business_org_body_matches_payload():
+    body = shasta_sdk._business_org_body(TRICKY, 1, 317, TRICKY)
+    assert orjson.loads(body) == {
+        "orgDisplayName": TRICKY,
+        "orgTypeId": 1,
+        "parentOrgId": 317,
+        "phone": "",
+        "notes": "",
+        "billingRecipients": "",
+        "orgAddress": {"addressLine": TRICKY},
+        "billingAddress": {"addressLine": TRICKY}
+    }
+
+
+def test_venue_body_matches_payload():
+    body = shasta_sdk._venue_body("3", TRICKY, TRICKY)
+    assert orjson.loads(body) == {
+        "orgId": "3",
+        "parentVenueId": 0,
+        "venueName": TRICKY,
+        "state": 1,
+        "venueType": 1,
+        "venueAddress": {"addressLine": TRICKY},
+        "shippingAddress": {"addressLine": TRICKY}
+    }
+
+
+def test_infrastructure_body_matches_payload():
+    body = shasta_sdk._infrastructure_body(1, 2, 3, "aa:bb:cc:dd:ee:ff", TRICKY)
+    assert orjson.loads(body) == {
+        "venueId": 2,
+        "orgId": 1,
+        "infraTypeId": 3,
+        "macAddress": "aa:bb:cc:dd:ee:ff",
+        "serialNumber": "",
+        "assetTag": "",
+        "infraDisplayName": TRICKY,
+        "sourceId": 1,
+        "realInfra": False
+    }
@@ -0,0 +1,192 @@
+import asyncio
+
+import aiohttp
+import orjson
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import shasta_sdk_async
+
+
+def serve(routes, scenario):
+    """Runs scenario(base_url) against a local aiohttp server on a fresh event loop."""
+    async def main():
+        app = web.Application()
+        app.add_routes(routes)
+        async with TestServer(app) as server:
+            try:
+                return await scenario(str(server.make_url("")).rstrip("/"))
+            finally:
+                await shasta_sdk_async.close()
+    return asyncio.run(main())
+
+
+def json_response(payload, status=200):
+    return web.Response(body=orjson.dumps(payload), status=status, content_type="application/json")
+
+
+def test_get_wrapper_decodes_json(monkeypatch):
+    async def orgs(request):
+        return json_response({"data": [{"orgId": 1}], "offset": request.query["offset"]})
+
+    async def scenario(base_url):
+        monkeypatch.setattr(shasta_sdk_async, "_ORG_CHILD_URL", f"{base_url}/orgs")
+        return await shasta_sdk_async.a_get_business_orgs(offset=5)
+
+    assert serve([web.get("/orgs", orgs)], scenario) == {"data": [{"orgId": 1}], "offset": "5"}
+
+
+def test_json_decodes_bodies_without_json_content_type(monkeypatch):
+    async def infra_types(request):
+        return web.Response(body=b'{"data": [1, 2]}', content_type="text/plain")
+
+    async def scenario(base_url):
+        monkeypatch.setattr(shasta_sdk_async, "_INFRATYPE_URL", f"{base_url}/infratype")
+        return await shasta_sdk_async.a_get_infra_types()
+
+    assert serve([web.get("/infratype", infra_types)], scenario) == {"data": [1, 2]}
+
+
+class FakeResponse:
+    def __init__(self, status, body=b"{}", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def read(self):
+        return self.body
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status)
+
+
+class FakeRequest:
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    async def __aenter__(self):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Stands in for the shared ClientSession, replaying queued responses or exceptions."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return FakeRequest(self.outcomes.pop(0))
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(shasta_sdk_async.asyncio, "sleep", fake_sleep)
+    return slept
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    def install(*outcomes):
+        session = FakeSession(*outcomes)
+        monkeypatch.setattr(shasta_sdk_async, "_get_session", lambda: session)
+        return session
+    return install
+
+
+def request(method):
+    return asyncio.run(shasta_sdk_async.a_handle_request_with_retries(method, "https://example.test/x"))
+
+
+@pytest.mark.parametrize("method", ["GET", "POST"])
+def test_429_is_retried(fake_session, sleeps, method):
+    session = fake_session(FakeResponse(429), FakeResponse(200))
+    assert request(method).status == 200
+    assert len(session.calls) == 2
+
+
+@pytest.mark.parametrize("status", [500, 502, 503, 504])
+def test_5xx_is_retried_for_get(fake_session, sleeps, status):
+    session = fake_session(FakeResponse(status), FakeResponse(200))
+    assert request("GET").status == 200
+    assert len(session.calls) == 2
+
+
+@pytest.mark.parametrize("status", [500, 502, 503, 504])
+def test_5xx_is_not_retried_for_post(fake_session, sleeps, status):
+    session = fake_session(FakeResponse(status), FakeResponse(201))
+    with pytest.raises(aiohttp.ClientResponseError):
+        request("POST")
+    assert len(session.calls) == 1
+    assert sleeps == []
+
+
+def test_connect_timeout_is_retried_for_post(fake_session, sleeps):
+    session = fake_session(aiohttp.ConnectionTimeoutError(), FakeResponse(201))
+    assert request("POST").status == 201
+    assert len(session.calls) == 2
+
+
+def test_read_timeout_is_not_retried_for_post(fake_session, sleeps):
+    session = fake_session(aiohttp.SocketTimeoutError(), FakeResponse(201))
+    with pytest.raises(asyncio.TimeoutError):
+        request("POST")
+    assert len(session.calls) == 1
+
+
+def test_read_timeout_is_retried_for_get(fake_session, sleeps):
+    session = fake_session(aiohttp.SocketTimeoutError(), FakeResponse(200))
+    assert request("GET").status == 200
+    assert len(session.calls) == 2
+
+
+def test_gives_up_after_max_retries(fake_session, sleeps):
+    session = fake_session(*[FakeResponse(429) for _ in range(shasta_sdk_async.MAX_RETRIES + 1)])
+    with pytest.raises(Exception, match="Failed after"):
+        request("GET")
+    assert len(session.calls) == shasta_sdk_async.MAX_RETRIES + 1
+    assert len(sleeps) == shasta_sdk_async.MAX_RETRIES
+
+
+def test_session_is_recreated_on_a_new_event_loop():
+    async def get_session(close):
+        session = shasta_sdk_async._get_session()
+        assert shasta_sdk_async._get_session() is session
+        if close:
+            await shasta_sdk_async.close()
+        return session
+
+    first = asyncio.run(get_session(close=False))
+    second = asyncio.run(get_session(close=True))
+    assert first is not second
+    assert second.closed
+
+
+def test_create_wrapper_sends_and_decodes_json(monkeypatch):
+    received = []
+
+    async def venues(request):
+        payload = orjson.loads(await request.read())
+        received.append(payload)
+        return json_response({"venueId": 7, "venueName": payload["venueName"]}, status=201)
+
+    async def scenario(base_url):
+        monkeypatch.setattr(shasta_sdk_async, "_VENUES_URL", f"{base_url}/venues")
+        return await shasta_sdk_async.a_create_venue(3, 'Main "HQ"', "1 Road\nSuite 2")
+
+    assert serve([web.post("/venues", venues)], scenario) == {"venueId": 7, "venueName": 'Main "HQ"'}
+    assert received[0]["orgId"] == 3
+    assert received[0]["venueAddress"] == {"addressLine": "1 Road\nSuite 2"}